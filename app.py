@@ -1,13 +1,24 @@
 # app.py
 from fastapi import FastAPI, Response, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import StreamingResponse, FileResponse
+from fastapi.responses import StreamingResponse, FileResponse, RedirectResponse
 from pydantic import BaseModel, Field
 from sqlmodel import select  # keep if you use it elsewhere
-import os, io, zipfile, logging, glob, base64
-from typing import Dict, Tuple, Optional, List
-import pandas as pd
+import os, io, re, csv, json, zipfile, logging, base64, functools, hashlib, threading, queue, asyncio
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+from itertools import islice
+from urllib.parse import quote
+from typing import Dict, Tuple, Optional, List, Set
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.feather as feather
 
 # ========= CONFIG =========
 USE_MOCK = os.getenv("USE_MOCK", "false").strip().lower() == "true"
@@ -60,6 +71,41 @@ app.add_middleware(
     allow_methods=["*"], allow_headers=["*"],
 )
 
+def _attachment_disposition(fname: str) -> str:
+    # same rule as Starlette's FileResponse: RFC 5987 form only for names that need escaping
+    quoted = quote(fname)
+    if quoted != fname:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{fname}"'
+
+class _NoStoreDownloads:
+    """
+    ASGI middleware: mark everything served under /downloads/ as no-store, and as an
+    attachment when /dl/file redirected there (?download=1); plain previews stay inline.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith("/downloads/"):
+            return await self.app(scope, receive, send)
+        attach = b"download=1" in scope.get("query_string", b"").split(b"&")
+        drop = (b"cache-control", b"content-disposition") if attach else (b"cache-control",)
+
+        async def send_no_store(message):
+            if message["type"] == "http.response.start":
+                headers = [(k, v) for k, v in message.get("headers", []) if k.lower() not in drop]
+                headers.append((b"cache-control", b"no-store"))
+                if attach:
+                    fname = scope["path"].rsplit("/", 1)[-1]
+                    headers.append((b"content-disposition", _attachment_disposition(fname).encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_no_store)
+
+app.add_middleware(_NoStoreDownloads)
+
 # Ensure downloads dir exists and mount for previews
 os.makedirs("downloads", exist_ok=True)
 app.mount("/downloads", StaticFiles(directory="downloads"), name="downloads")
@@ -69,15 +115,21 @@ try:
     from reportlab.lib.pagesizes import A4
     from reportlab.pdfgen import canvas
     from reportlab.lib.utils import simpleSplit
+    from reportlab.pdfbase import pdfmetrics
     REPORTLAB_OK = True
 except Exception:
     REPORTLAB_OK = False
 
+# text simpleSplit would reshape: newlines/tabs/other whitespace, runs of spaces, edge spaces
+_NEEDS_SPLIT = re.compile(r"[^\S ]|  |^ | $")
 
-def _create_pdf_with_details(path: str, title: str, details: dict):
-    """Create a readable PDF; fallback to minimal PDF if reportlab missing."""
-    if not REPORTLAB_OK:
-        content = f"""%PDF-1.4
+@functools.lru_cache(maxsize=None)
+def _body_font():
+    """Helvetica metrics, resolved once instead of a registry lookup per stringWidth() call."""
+    return pdfmetrics.getFont("Helvetica")
+
+# minimal single-page PDF used when reportlab is missing; only the title varies
+_MIN_PDF_TEMPLATE = """%PDF-1.4
 1 0 obj<<>>endobj
 2 0 obj<< /Length 44 >>stream
 BT /F1 24 Tf 72 720 Td ({title}) Tj ET
@@ -99,6 +151,15 @@ trailer<< /Size 7 /Root 6 0 R >>
 startxref
 533
 %%EOF"""
+
+
+def _create_pdf_with_details(path, title: str, details: dict):
+    """Create a readable PDF at path (file name or binary file object); fallback to minimal PDF if reportlab missing."""
+    if not REPORTLAB_OK:
+        content = _MIN_PDF_TEMPLATE.format(title=title)
+        if hasattr(path, "write"):
+            path.write(content.encode("latin-1"))
+            return
         with open(path, "w", encoding="latin-1") as f:
             f.write(content)
         return
@@ -108,13 +169,19 @@ startxref
     y = H - 50
     c.setFont("Helvetica-Bold", 18); c.drawString(40, y, title); y -= 30
     c.setFont("Helvetica", 11)
+    max_w = W - 80
 
     def kv(lbl, val):
         nonlocal y
         if y < 80:
             c.showPage(); y = H - 50; c.setFont("Helvetica", 11)
         txt = f"{lbl}: {('N/A' if val in (None, '') else str(val))}"
-        for line in simpleSplit(txt, "Helvetica", 11, W - 80):
+        # most lines are plain and fit: one width measurement instead of simpleSplit's word-by-word pass
+        if not _NEEDS_SPLIT.search(txt) and _body_font().stringWidth(txt, 11) <= max_w:
+            lines = [txt]
+        else:
+            lines = simpleSplit(txt, "Helvetica", 11, max_w)
+        for line in lines:
             c.drawString(40, y, line); y -= 16
 
     details = details or {}
@@ -130,10 +197,15 @@ startxref
     # If you still want some extra lines, print them quietly (no heading)
     sample = details.get("sample_data") or {}
     if SHOW_SAMPLE_LINES and sample:
-        for k, v in list(sample.items())[:12]:
+        for k, v in islice(sample.items(), 12):
             kv(k, v)
 
     c.showPage(); c.save()
+
+def _render_pdf_bytes(title: str, details: dict) -> bytes:
+    buf = io.BytesIO()
+    _create_pdf_with_details(buf, title, details)
+    return buf.getvalue()
 # =============================================================
 
 # ---------- helpers ----------
@@ -150,10 +222,60 @@ def _ensure_min_fields(details: dict) -> dict:
     details.setdefault("raw_source",{"url":""})
     return details
 
+def _truncate_repr(obj, limit: int = 500) -> str:
+    """repr()-like preview of obj that stops walking once limit chars are produced."""
+    parts: List[str] = []
+    size = 0
+
+    def emit(txt: str):
+        nonlocal size
+        parts.append(txt); size += len(txt)
+
+    def walk(o):
+        if size >= limit:
+            return
+        if isinstance(o, dict):
+            emit("{")
+            for i, (k, v) in enumerate(o.items()):
+                if size >= limit: return
+                if i: emit(", ")
+                emit(repr(k)); emit(": "); walk(v)
+            emit("}")
+        elif isinstance(o, (list, tuple)):
+            emit("[")
+            for i, v in enumerate(o):
+                if size >= limit: return
+                if i: emit(", ")
+                walk(v)
+            emit("]")
+        elif isinstance(o, str):
+            emit(repr(o[:limit]))  # never repr a huge string in full
+        else:
+            emit(repr(o))
+
+    walk(obj)
+    return "".join(parts)[:limit]
+
+# names known to exist under downloads/; a read that finds one gone drops it again
+_EXISTING_FILES: Set[str] = set()
+
+def _download_exists(fname: str) -> bool:
+    """os.path.exists for downloads/<fname>, remembering hits so repeat checks skip the stat()."""
+    if fname in _EXISTING_FILES:
+        return True
+    if os.path.exists(os.path.join("downloads", fname)):
+        _EXISTING_FILES.add(fname)
+        return True
+    return False
+
+def _forget_download(fname: str) -> None:
+    """Drop fname from the existence cache after it went missing on disk."""
+    _EXISTING_FILES.discard(fname)
+
 def _ensure_logo_png():
     """Create a tiny placeholder logo at /downloads/logo.png (1x1 transparent PNG)."""
     logo_path = os.path.join("downloads", "logo.png")
-    if os.path.exists(logo_path):
+    if _download_exists("logo.png"):
         return
     tiny_png_b64 = (
         "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGNgYAAAAAMA"
@@ -161,6 +283,80 @@ def _ensure_logo_png():
     )
     with open(logo_path, "wb") as f:
         f.write(base64.b64decode(tiny_png_b64))
+    _EXISTING_FILES.add("logo.png")
+
+# judgment PDFs are content-addressed: judgment_<num>_<digest>.pdf
+_JUDGMENT_PDFS: "OrderedDict[int, List[str]]" = OrderedDict()  # num -> recent file names (newest last), LRU
+_JUDGMENT_PDFS_MAX = 1024
+# older versions stay on disk a while: names already sent in documents[] must keep opening
+_JUDGMENT_VERSIONS = 4
+_JUDGMENT_LOCK = threading.Lock()
+# legacy judgment_<num>.pdf, or the versioned name _judgment_pdf hands out
+_JUDGMENT_NAME_RE = re.compile(r"judgment_(\d+)(?:_([0-9a-f]{16}))?\.pdf")
+
+def _details_digest(details: dict) -> str:
+    # canonical JSON: nested dicts (raw_source, scraper payloads) hash the same in any key order
+    blob = json.dumps(details, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return hashlib.blake2b(blob, digest_size=8).hexdigest()
+
+def _judgment_pdf(num: int, details: dict) -> str:
+    """Return the judgment PDF file name for these details, rendering it only if missing."""
+    h = _details_digest(details)
+    fname = f"judgment_{num}_{h}.pdf"
+    path = os.path.join("downloads", fname)
+    if not _download_exists(fname):
+        # write aside and rename so concurrent requests never serve a half-written file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_render_pdf_bytes(f"Judgment for {num}", details))
+            os.replace(tmp_path, path)
+        finally:
+            # only left behind if rendering or the rename failed
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        _EXISTING_FILES.add(fname)
+    with _JUDGMENT_LOCK:
+        versions = _JUDGMENT_PDFS.setdefault(num, [])
+        if fname in versions:
+            versions.remove(fname)
+        versions.append(fname)
+        expired = versions[:-_JUDGMENT_VERSIONS]
+        del versions[:-_JUDGMENT_VERSIONS]
+        _JUDGMENT_PDFS.move_to_end(num)
+        while len(_JUDGMENT_PDFS) > _JUDGMENT_PDFS_MAX:
+            _JUDGMENT_PDFS.popitem(last=False)
+    # details changed often enough that this version fell out of the window: don't let downloads/ grow per edit
+    for old in expired:
+        _forget_download(old)
+        try:
+            os.remove(os.path.join("downloads", old))
+        except FileNotFoundError:
+            pass
+    return fname
+
+@functools.lru_cache(maxsize=256)
+def _judgment_pdf_bytes(fname: str) -> bytes:
+    # names carry the details digest, so a given file never changes once written
+    with open(os.path.join("downloads", fname), "rb") as f:
+        return f.read()
+
+def _read_judgment_pdf(fname: str) -> Optional[bytes]:
+    """Bytes of a rendered judgment PDF, or None (and forgotten) if it was removed from downloads/."""
+    try:
+        return _judgment_pdf_bytes(fname)
+    except FileNotFoundError:
+        _forget_download(fname)
+        return None
+
+def _latest_judgment_pdf(num: int) -> Optional[str]:
+    """File name of the most recent judgment PDF rendered for num, unless it is known to be gone."""
+    with _JUDGMENT_LOCK:
+        versions = _JUDGMENT_PDFS.get(num)
+        latest = versions[-1] if versions else None
+    if latest and _download_exists(latest):
+        return latest
+    return None
 
 @app.get("/chrome.devtools.json", include_in_schema=False)
 def _devtools_noise(): return Response(status_code=204)
@@ -169,117 +365,427 @@ def _devtools_noise(): return Response(status_code=204)
 def favicon(): return Response(status_code=204)
 
 # ---------- dataset loader ----------
-DATASET_ROWS: Dict[Tuple[int,int], dict] = {}
-CASE_INDEX: Dict[int,Tuple[int,int]] = {}
+# case number -> (dataset code, row): sorted keys + parallel arrays
+CaseIndex = Tuple[np.ndarray, np.ndarray, np.ndarray]
+_EMPTY_INDEX = np.empty(0, dtype=np.int64)
+# (columnar table per dataset code, parties/filing_date/next_hearing/status per row, case index).
+# Reloads build all three aside and publish them in one assignment, so a lookup
+# running mid-reload sees either the old or the new data, never a mix.
+DATASETS: Tuple[Dict[int, pa.Table], Dict[int, pa.Table], CaseIndex] = (
+    {}, {}, (_EMPTY_INDEX, _EMPTY_INDEX, _EMPTY_INDEX))
+# bumped after each publish; part of the lookup cache key, so entries built from older data are never hit again
+DATASETS_GEN = 0
 DATASET_SUMMARY: Dict[int,int] = {}
 SCANNED_DIRS: List[str] = []
+# quoted cells may span lines; Arrow only handles that across read blocks when told to
+_CSV_PARSE = pacsv.ParseOptions(newlines_in_values=True)
+_NDAP_RE = re.compile(r"NDAP_REPORT_(\d+)\.csv$")
+# below this much stale CSV, starting a pool (each worker re-imports the app) costs more than it saves
+_POOL_MIN_BYTES = 64 << 20
+_TITLE_KEYS = ("case_title", "title", "parties", "case name", "case_name")
 
 def _scan_dirs() -> List[str]:
     return [d for d in DATASET_DIRS if os.path.isdir(d)]
 
-def _best_parties_from_row(data: dict) -> Optional[str]:
+def _cache_path(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + ".feather"
+
+# bump whenever _parse_csv's output changes (parse options, column types) to invalidate every cache
+_CACHE_VERSION = b"1"
+
+def _cache_stamp(csv_path: str) -> Dict[bytes, bytes]:
+    """What a cache was built from; stored in its schema metadata. Exact match, so older copies (cp -p, rsync -a) count too."""
+    st = os.stat(csv_path)
+    return {b"csv_size": str(st.st_size).encode(), b"csv_mtime_ns": str(st.st_mtime_ns).encode(),
+            b"cache_version": _CACHE_VERSION}
+
+def _cache_is_fresh(csv_path: str) -> bool:
+    try:
+        # only the schema is read; the mmap keeps this cheap for big caches
+        with pa.memory_map(_cache_path(csv_path)) as src:
+            meta = pa.ipc.open_file(src).schema.metadata or {}
+        return all(meta.get(k) == v for k, v in _cache_stamp(csv_path).items())
+    except Exception:
+        return False  # no cache yet, or not a readable Arrow file
+
+def _csv_convert_options(csv_path: str) -> pacsv.ConvertOptions:
+    """Read every column as string so values keep their source text (no date/number inference)."""
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f), [])
+    return pacsv.ConvertOptions(column_types={name: pa.string() for name in header},
+                                strings_can_be_null=True, null_values=[""])
+
+def _read_ragged_csv(csv_path: str) -> pa.Table:
+    """
+    Slow path for files Arrow rejects over rows with the wrong number of cells:
+    pad short rows with nulls (as pandas did) and cut long ones, so the report
+    and its row numbering (case number = code + row) survive one bad line.
+    """
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        width = len(header)
+        cols: List[List[Optional[str]]] = [[] for _ in header]
+        ragged = 0
+        for line in reader:
+            if not line:
+                continue  # blank line; skipped by Arrow and pandas alike
+            if len(line) != width:
+                ragged += 1
+                line = (line + [""] * width)[:width]
+            for col, value in zip(cols, line):
+                col.append(value or None)
+    logger.warning("%s: padded/trimmed %d rows with the wrong number of cells", csv_path, ragged)
+    return pa.Table.from_arrays([pa.array(col, type=pa.string()) for col in cols], names=header)
+
+def _as_string_column(col: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Whole-column cast to string with "" for blanks; no-op passes are skipped."""
+    if col.type != pa.string():
+        col = col.cast(pa.string())
+    return pc.fill_null(col, "") if col.null_count else col
+
+def _parse_one(csv_path: str) -> Optional[pa.Table]:
+    """
+    Worker-process entry: parse one CSV into its .feather cache. Returns None
+    when the parent can mmap the cache, else the table itself (cache not writable).
+    """
+    stamp = _cache_stamp(csv_path)  # before parsing: a CSV changed mid-parse must not look fresh
+    # one thread per worker; the pool already spreads files across cores
+    table = _parse_csv(csv_path, use_threads=False)
+    return None if _write_cache(table, _cache_path(csv_path), stamp) else table
+
+def _read_report(csv_path: str, use_threads: bool = True) -> pa.Table:
+    """
+    Load one NDAP report as an all-string Arrow table ("" for blanks).
+    The parsed table is cached next to the CSV as .feather and memory-mapped
+    on later loads; it is rebuilt whenever the CSV's size or mtime, or the
+    parser version, differs from what the cache was built from.
     """
-    Try to produce human 'party names' from a CSV row.
+    cache_path = _cache_path(csv_path)
+    if _cache_is_fresh(csv_path):
+        try:
+            return feather.read_table(cache_path, memory_map=True)
+        except Exception as e:
+            logger.warning("Unreadable cache %s, re-parsing CSV: %s", cache_path, e)
+    stamp = _cache_stamp(csv_path)
+    table = _parse_csv(csv_path, use_threads)
+    _write_cache(table, cache_path, stamp)
+    return table
+
+def _parse_csv(csv_path: str, use_threads: bool) -> pa.Table:
+    """Parse one CSV into the all-string table _read_report serves; no caching here."""
+    try:
+        table = pacsv.read_csv(csv_path, read_options=pacsv.ReadOptions(use_threads=use_threads),
+                               parse_options=_CSV_PARSE,
+                               convert_options=_csv_convert_options(csv_path))
+    except pa.ArrowInvalid as e:
+        # e.g. "Expected 4 columns, got 2": Arrow fails the whole file where pandas padded the row
+        logger.warning("Arrow could not parse %s (%s); using the row-padding reader", csv_path, e)
+        table = _read_ragged_csv(csv_path)
+    return pa.Table.from_arrays([_as_string_column(col) for col in table.columns],
+                                names=table.column_names)
+
+def _write_cache(table: pa.Table, cache_path: str, stamp: Dict[bytes, bytes]) -> bool:
+    # uncompressed so the mmap'd read is zero-copy; the temp name is private to this
+    # process/thread so concurrent reloads, pool workers and uvicorn workers never interleave
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        feather.write_feather(table.replace_schema_metadata(stamp), tmp_path, compression="uncompressed")
+        os.replace(tmp_path, cache_path)
+        return True
+    except OSError as e:
+        logger.warning("Cannot cache %s: %s", cache_path, e)
+        return False
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _blank_to_null(arr):
+    return pc.if_else(pc.equal(arr, ""), pa.scalar(None, pa.string()), arr)
+
+def _column(table: pa.Table, name: Optional[str]):
+    """Column by (already lowercased) name, or None; first one wins on duplicates."""
+    names = table.column_names
+    return table.column(names.index(name)) if name in names else None
+
+def _pick_column(table: pa.Table, key: str):
+    col = _column(table, key)
+    return _blank_to_null(col) if col is not None else None
+
+def _vs_column(table: pa.Table, left: str, right: str):
+    """'<left> vs <right>' for rows where either side is present, else null."""
+    a, b = _pick_column(table, left), _pick_column(table, right)
+    if a is None and b is None:
+        return None
+    n = table.num_rows
+    a = a if a is not None else pa.nulls(n, pa.string())
+    b = b if b is not None else pa.nulls(n, pa.string())
+    joined = pc.binary_join_element_wise(
+        pc.utf8_trim_whitespace(pc.fill_null(a, left.title())),
+        pc.utf8_trim_whitespace(pc.fill_null(b, right.title())), " vs ")
+    return pc.if_else(pc.or_(pc.is_valid(a), pc.is_valid(b)), joined, pa.scalar(None, pa.string()))
+
+def _best_parties_column(table: pa.Table):
+    """
+    Try to produce human 'party names' for every CSV row at once.
     Falls back to any of these columns if present:
       - case_title / title / parties
       - petitioner + respondent
       - plaintiff + defendant
+    Rows with nothing usable stay null.
     """
-    if not data:
-        return None
+    candidates = []
     # direct titles
-    for key in ["case_title", "title", "parties", "case name", "case_name"]:
-        v = data.get(key) or data.get(key.title()) or data.get(key.upper())
-        if v and str(v).strip():
-            return str(v).strip()
-    # petitioner/respondent
-    pet = data.get("petitioner") or data.get("Petitioner") or data.get("PETITIONER")
-    res = data.get("respondent") or data.get("Respondent") or data.get("RESPONDENT")
-    if pet or res:
-        return f"{str(pet or 'Petitioner').strip()} vs {str(res or 'Respondent').strip()}"
-    # plaintiff/defendant
-    pl = data.get("plaintiff") or data.get("Plaintiff") or data.get("PLAINTIFF")
-    df = data.get("defendant") or data.get("Defendant") or data.get("DEFENDANT")
-    if pl or df:
-        return f"{str(pl or 'Plaintiff').strip()} vs {str(df or 'Defendant').strip()}"
+    for key in _TITLE_KEYS:
+        col = _pick_column(table, key)
+        if col is not None:
+            candidates.append(_blank_to_null(pc.utf8_trim_whitespace(col)))
+    candidates.append(_vs_column(table, "petitioner", "respondent"))
+    candidates.append(_vs_column(table, "plaintiff", "defendant"))
+    candidates = [c for c in candidates if c is not None]
+    if not candidates:
+        return pa.nulls(table.num_rows, pa.string())
+    return pc.coalesce(*candidates) if len(candidates) > 1 else candidates[0]
+
+def _column_or(table: pa.Table, name: Optional[str], default: str):
+    col = _column(table, name)
+    if col is None:
+        return pa.nulls(table.num_rows, pa.string()).fill_null(default)
+    return pc.if_else(pc.equal(col, ""), default, col)
+
+def _derive_columns(table: pa.Table) -> pa.Table:
+    """Precompute the per-row fields served by /cases/lookup."""
+    year_col = next((c for c in table.column_names if "year" in c), None)
+    return pa.table({
+        "parties": _best_parties_column(table),
+        "filing_date": _column_or(table, year_col, "N/A"),
+        "next_hearing": _column_or(table, "next_hearing", "N/A"),
+        "status": _column_or(table, "status", "From NDAP Dataset"),
+    })
+
+def _build_case_index(sizes: Dict[int, int]) -> CaseIndex:
+    """Map case number code+row -> (code, row) for every loaded row."""
+    if not sizes:
+        return (_EMPTY_INDEX, _EMPTY_INDEX, _EMPTY_INDEX)
+    codes = np.repeat(np.fromiter(sizes.keys(), dtype=np.int64), list(sizes.values()))
+    rows = np.concatenate([np.arange(n, dtype=np.int64) for n in sizes.values()])
+    keys = codes + rows
+    # on overlapping ranges the dataset loaded last wins; np.unique keeps first hits, so scan reversed
+    uniq, first = np.unique(keys[::-1], return_index=True)
+    pick = len(keys) - 1 - first
+    return (uniq, codes[pick], rows[pick])
+
+def _case_location(index: CaseIndex, case_number: int) -> Optional[Tuple[int, int]]:
+    keys, codes, rows = index
+    pos = int(np.searchsorted(keys, case_number))
+    if pos < len(keys) and keys[pos] == case_number:
+        return int(codes[pos]), int(rows[pos])
     return None
 
+def _parse_stale_reports(paths: List[str]) -> Tuple[Dict[str, pa.Table], Set[str]]:
+    """
+    Parse stale CSVs in a process pool when there is enough work to pay for one.
+    Returns the tables workers could not cache (parent uses them as is) and the
+    paths whose parse failed; anything else is left to the parent's serial pass.
+    """
+    parsed: Dict[str, pa.Table] = {}; failed: Set[str] = set()
+    # a directory we can't write to means no cache to hand back through: parse those in the parent
+    stale = [p for p in paths if not _cache_is_fresh(p) and os.access(os.path.dirname(p) or ".", os.W_OK)]
+    try:
+        if len(stale) < 2 or sum(os.path.getsize(p) for p in stale) < _POOL_MIN_BYTES:
+            return parsed, failed
+        # never fork: reloads run on a threadpool thread of a multithreaded server
+        ctx = multiprocessing.get_context(
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+        with ProcessPoolExecutor(max_workers=min(len(stale), os.cpu_count() or 1),
+                                 mp_context=ctx) as ex:
+            futures = [(path, ex.submit(_parse_one, path)) for path in stale]
+            for path, fut in futures:
+                try:
+                    table = fut.result()
+                except BrokenProcessPool:
+                    continue  # pool died; the parent parses what is left
+                except Exception as e:
+                    logger.warning("Failed to read %s: %s", path, e)
+                    failed.add(path); continue
+                if table is not None:
+                    parsed[path] = table
+    except Exception as e:
+        logger.warning("Parallel CSV parse unavailable, parsing serially: %s", e)
+    return parsed, failed
+
 def _load_ndap_datasets() -> int:
-    global DATASET_ROWS, CASE_INDEX, DATASET_SUMMARY, SCANNED_DIRS
-    DATASET_ROWS.clear(); CASE_INDEX.clear(); DATASET_SUMMARY.clear()
-    SCANNED_DIRS = _scan_dirs()
+    global DATASETS, DATASETS_GEN, DATASET_SUMMARY, SCANNED_DIRS
+    scanned = _scan_dirs()
+    tables: Dict[int, pa.Table] = {}; derived: Dict[int, pa.Table] = {}; summary: Dict[int, int] = {}
     total = 0
-    for folder in SCANNED_DIRS:
-        for report_path in glob.glob(os.path.join(folder, "NDAP_REPORT_*.csv")):
-            fname = os.path.basename(report_path)
+    reports: List[Tuple[int, str]] = []
+    for folder in scanned:
+        with os.scandir(folder) as it:
+            for entry in it:
+                m = _NDAP_RE.match(entry.name)
+                if m and entry.is_file(): reports.append((int(m.group(1)), entry.path))
+
+    # parse stale CSVs in parallel; the parent then mmaps the fresh .feather caches
+    parsed, failed = _parse_stale_reports([path for _, path in reports])
+
+    for code, report_path in reports:
+        if report_path in failed: continue  # a worker already tried and logged it
+        table = parsed.pop(report_path, None)
+        if table is None:
             try:
-                code = int(fname.split("_")[-1].split(".")[0])
-            except Exception:
-                logger.warning("Skip: cannot parse code from %s", report_path); continue
-            try:
-                df = pd.read_csv(report_path)
+                table = _read_report(report_path)
             except Exception as e:
                 logger.warning("Failed to read %s: %s", report_path, e); continue
-            if df.empty: continue
-            DATASET_SUMMARY[code] = len(df); total += len(df)
-            cols = list(df.columns)
-            year_col = next((c for c in cols if "year" in c.lower()), None)
-            for idx, row in df.iterrows():
-                row_dict = {c: ("" if pd.isna(row[c]) else str(row[c])) for c in cols}
-                DATASET_ROWS[(code, idx)] = {"dataset_code":code,"row_index":idx,"data":row_dict,"year_col":year_col}
-                if idx == 0: CASE_INDEX[code] = (code, 0)
-                CASE_INDEX[code + idx] = (code, idx)
+        n = table.num_rows
+        if not n: continue
+        # normalize headers once so every lookup below is a plain lowercase key
+        table = table.rename_columns([c.strip().lower() for c in table.column_names])
+        summary[code] = n; total += n
+        tables[code] = table
+        derived[code] = _derive_columns(table)
+    # rows stay in Arrow buffers; only the index is built here
+    DATASETS = (tables, derived, _build_case_index(summary))
+    DATASETS_GEN += 1  # after the publish: whoever sees the new generation also sees the new data
+    DATASET_SUMMARY, SCANNED_DIRS = summary, scanned
     logger.info("Loaded rows=%s | datasets=%s | scanned=%s", total, DATASET_SUMMARY, SCANNED_DIRS)
     return total
 
 def _dataset_lookup_by_case(case_number: int) -> Optional[dict]:
+    # cached result is shared; hand out a copy so callers can setdefault() freely
+    result = _lookup_impl(int(case_number), DATASETS_GEN)
+    return dict(result) if result else None
+
+@functools.lru_cache(maxsize=4096)
+def _lookup_impl(case_number: int, gen: int) -> Optional[dict]:
+    # gen only keys the cache; a lookup racing a reload may cache new data under the old
+    # generation, which is harmless, but never old data under the new one
+
     # 1) manual overrides first
     if case_number in OVERRIDE_CASES:
         return OVERRIDE_CASES[case_number]
 
     # 2) CSV-backed mapping
-    key = CASE_INDEX.get(int(case_number))
+    tables, derived, index = DATASETS  # one snapshot, even if a reload publishes meanwhile
+    key = _case_location(index, case_number)
     if not key: return None
     code, idx = key
-    row = DATASET_ROWS.get((code, idx)) or {}
-    data = row.get("data") or {}; year_col = row.get("year_col")
-
-    # derive party names nicely
-    parties_name = _best_parties_from_row(data)
-    if not parties_name:
-        # fallback to readable placeholder if nothing in CSV:
-        parties_name = f"Case {code}-{idx}"
+    table = tables[code]
+    # materialize just this row, and only the few columns the API returns
+    sample = table.select(range(min(5, table.num_columns))).slice(idx, 1).to_pylist()[0]
+    fields = derived[code].slice(idx, 1).to_pylist()[0]
 
     result = {
-        "parties": parties_name,
-        "filing_date": (data.get(year_col) if year_col else "N/A") or "N/A",
-        "next_hearing": data.get("next_hearing") or "N/A",
-        "status": data.get("status") or "From NDAP Dataset",
+        # fallback to readable placeholder if nothing in CSV:
+        "parties": fields["parties"] or f"Case {code}-{idx}",
+        "filing_date": fields["filing_date"],
+        "next_hearing": fields["next_hearing"],
+        "status": fields["status"],
         "raw_source": {"url": "https://ndap.niti.gov.in"},
     }
     # keep a few columns in API (optional)
-    result["sample_data"] = {k: data[k] for k in list(data.keys())[:5]}
+    result["sample_data"] = sample
     return result
 
 # ---------- startup ----------
+CAUSE_LIST_NAME = "cause_list_demo.pdf"
+_CAUSE_LIST_DETAILS = {"status": "Generated", "raw_source": {"url": "https://example.invalid"}}
+CAUSE_LIST_BYTES = b""
+
+def _ensure_cause_list():
+    """
+    Render the demo cause list once; keep the bytes for /dl/file and a copy on
+    disk for /downloads. Also warms ReportLab's lazy font setup before the first request.
+    """
+    global CAUSE_LIST_BYTES
+    CAUSE_LIST_BYTES = _render_pdf_bytes("Cause List Demo", _CAUSE_LIST_DETAILS)
+    c_path = os.path.join("downloads", CAUSE_LIST_NAME)
+    if not _download_exists(CAUSE_LIST_NAME):
+        with open(c_path, "wb") as f:
+            f.write(CAUSE_LIST_BYTES)
+        _EXISTING_FILES.add(CAUSE_LIST_NAME)
+
 @app.on_event("startup")
 def _startup():
     init_db()
+    with os.scandir("downloads") as it:
+        _EXISTING_FILES.update(e.name for e in it if e.is_file())
     _ensure_logo_png()
+    _ensure_cause_list()
     count = _load_ndap_datasets()
     logger.info("DB initialized; USE_MOCK=%s; ndap_rows=%s", USE_MOCK, count)
 
+# ---------- query log (batched writes) ----------
+LOG_QUEUE: "queue.SimpleQueue[QueryLog]" = queue.SimpleQueue()  # thread-safe: lookups run in the threadpool
+_LOG_BATCH = 100
+_LOG_FLUSH_SECS = 0.5
+_log_task: Optional[asyncio.Task] = None
+
+def _drain_logs(limit: int = _LOG_BATCH) -> List[QueryLog]:
+    rows: List[QueryLog] = []
+    while len(rows) < limit:
+        try:
+            rows.append(LOG_QUEUE.get_nowait())
+        except queue.Empty:
+            break
+    return rows
+
+def _write_logs(rows: List[QueryLog]):
+    """One session and one commit for a whole batch; if that fails, retry row by row so one bad row loses only itself."""
+    try:
+        with get_session() as ses:
+            ses.add_all(rows)
+            ses.commit()
+        return
+    except Exception:
+        if len(rows) == 1:
+            raise
+        logger.warning("QueryLog batch of %d failed; retrying rows one at a time", len(rows))
+    for row in rows:
+        try:
+            with get_session() as ses:
+                ses.add(row)
+                ses.commit()
+        except Exception:
+            logger.exception("QueryLog write failed; dropped row for case %s", row.case_number)
+
+async def _log_flusher():
+    while True:
+        await asyncio.sleep(_LOG_FLUSH_SECS)
+        rows = _drain_logs()
+        while rows:
+            try:
+                await run_in_threadpool(_write_logs, rows)
+            except Exception:
+                logger.exception("QueryLog flush failed; dropped %d rows", len(rows))
+            rows = _drain_logs()
+
+@app.on_event("startup")
+async def _start_log_flusher():
+    global _log_task
+    _log_task = asyncio.create_task(_log_flusher())
+
+@app.on_event("shutdown")
+async def _stop_log_flusher():
+    if _log_task:
+        _log_task.cancel()
+    # whatever is still queued goes out before exit
+    rows = _drain_logs()
+    while rows:
+        _write_logs(rows)
+        rows = _drain_logs()
+
 # ---------- schema ----------
 class CaseQuery(BaseModel):
     case_type: str = Field(..., min_length=1)
-    case_number: int = Field(..., gt=0)
+    case_number: int = Field(..., gt=0, le=2**63 - 1)  # SQLite INTEGER range
     year: int = Field(..., ge=1950, le=2100)
     court_level: str = Field(..., min_length=1)
 
 # ---------- utility routes ----------
 @app.get("/ping")
 def ping():
-    return {"status":"ok","mock":USE_MOCK,"ndap_rows":len(DATASET_ROWS),
+    return {"status":"ok","mock":USE_MOCK,"ndap_rows":sum(DATASET_SUMMARY.values()),
             "datasets":DATASET_SUMMARY,"scanned_dirs":SCANNED_DIRS}
 
 @app.get("/datasets/list")
@@ -321,24 +827,19 @@ def lookup_case(q: CaseQuery):
 
     details = _ensure_min_fields(details)
 
-    # Always rebuild the judgment PDF with current details (no stale files)
-    j_path = f"downloads/judgment_{q.case_number}.pdf"
-    _create_pdf_with_details(j_path, f"Judgment for {q.case_number}", details)
+    # Judgment PDF is keyed by a digest of the details, so it is only rebuilt when they change
+    j_path = os.path.join("downloads", _judgment_pdf(q.case_number, details))
 
-    # Cause list: create once if missing
-    c_path = "downloads/cause_list_demo.pdf"
-    if not os.path.exists(c_path):
-        _create_pdf_with_details(c_path, "Cause List Demo",
-                                 {"status":"Generated","raw_source":{"url":"https://example.invalid"}})
+    # Cause list: rendered once at startup
+    c_path = os.path.join("downloads", CAUSE_LIST_NAME)
 
-    # Log query
+    # Log query (queued; _log_flusher commits in batches)
     status_flag = "ok" if details.get("status") != "Error" else "error"
-    with get_session() as ses:
-        ses.add(QueryLog(case_type=q.case_type, case_number=q.case_number, year=q.year,
-                         court_level=q.court_level, status=status_flag,
-                         source_url=details.get("raw_source",{}).get("url",""),
-                         html_preview=str(details)[:500]))
-        ses.commit()
+    LOG_QUEUE.put(QueryLog(case_type=q.case_type, case_number=q.case_number, year=q.year,
+                           court_level=q.court_level, status=status_flag,
+                           source_url=details.get("raw_source",{}).get("url",""),
+                           html_preview=_truncate_repr({k: v for k, v in details.items()
+                                                       if k != "sample_data"})))
 
     return {"input": q.model_dump(),
             "parsed": details,
@@ -351,53 +852,70 @@ def lookup_case(q: CaseQuery):
             ]}
 
 # ---------- dedicated download (no cache; always attachment) ----------
+_NO_CACHE_HEADERS = {
+    "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
+    "Pragma": "no-cache",
+    "Expires": "0",
+}
+
+def _pdf_download(content: bytes, fname: str) -> Response:
+    return Response(content=content, media_type="application/pdf",
+                    headers={**_NO_CACHE_HEADERS, "Content-Disposition": _attachment_disposition(fname)})
+
 @app.get("/dl/file/{fname}")
 def dl_file(fname: str):
     """
-    Force download. If it's a judgment_<num>.pdf, regenerate it with the
-    best available details so you never get an empty placeholder.
+    Force download. A judgment_<num>_<digest>.pdf still on disk is served as is,
+    so a name from /cases/lookup keeps its content. Otherwise (or for a plain
+    judgment_<num>.pdf) serve the PDF for the best available details, rendering
+    it if that version is missing, so you never get an empty placeholder.
     """
-    path = os.path.join("downloads", fname)
-
-    # If it's a judgment PDF, parse number and regenerate with details
+    # If it's a judgment PDF, parse number and resolve the current version
     if fname.startswith("judgment_") and fname.endswith(".pdf"):
-        try:
-            num = int(fname[len("judgment_"):-4])
-        except Exception:
+        m = _JUDGMENT_NAME_RE.fullmatch(fname)
+        if not m:
             raise HTTPException(status_code=400, detail="Bad judgment file name")
+        num = int(m.group(1))
+        if m.group(2) and _download_exists(fname):
+            content = _read_judgment_pdf(fname)
+            if content is not None:
+                return _pdf_download(content, fname)
 
         details = _dataset_lookup_by_case(num)
+        content = None
         if not details:
-            if USE_MOCK:
-                details = {
-                    "parties": "CIVIL Demo: Alice vs Bob",
-                    "filing_date": "2023-07-18",
-                    "next_hearing": "2025-10-10",
-                    "status": "Listed",
-                    "raw_source": {"url": "https://services.ecourts.gov.in"},
-                }
-            else:
-                details = _as_error("No dataset/mocked details available", "server")
-
-        _create_pdf_with_details(path, f"Judgment for {num}", details)
-
-    else:
-        # Known demo file; create if missing
-        if fname == "cause_list_demo.pdf" and not os.path.exists(path):
-            _create_pdf_with_details(path, "Cause List Demo", {"status": "Generated"})
-        elif not os.path.exists(path):
-            raise HTTPException(status_code=404, detail="File not found")
-
-    return FileResponse(
-        path,
-        media_type="application/pdf",
-        filename=fname,
-        headers={
-            "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
-            "Pragma": "no-cache",
-            "Expires": "0",
-        },
-    )
+            # no dataset row: reuse whatever /cases/lookup rendered last (e.g. live details)
+            latest = _latest_judgment_pdf(num)
+            content = _read_judgment_pdf(latest) if latest else None
+        if content is None:
+            if not details:
+                if USE_MOCK:
+                    details = {
+                        "parties": "CIVIL Demo: Alice vs Bob",
+                        "filing_date": "2023-07-18",
+                        "next_hearing": "2025-10-10",
+                        "status": "Listed",
+                        "raw_source": {"url": "https://services.ecourts.gov.in"},
+                    }
+                else:
+                    details = _as_error("No dataset/mocked details available", "server")
+            content = _read_judgment_pdf(_judgment_pdf(num, details))
+            if content is None:
+                # deleted after the existence check: the name is forgotten now, so this renders it again
+                content = _read_judgment_pdf(_judgment_pdf(num, details))
+            if content is None:
+                raise HTTPException(status_code=404, detail="File not found")
+        return _pdf_download(content, fname)
+
+    # Known demo file; served from memory
+    if fname == CAUSE_LIST_NAME:
+        return _pdf_download(CAUSE_LIST_BYTES, fname)
+    if not _download_exists(fname):
+        raise HTTPException(status_code=404, detail="File not found")
+
+    # anything else already on disk: let the StaticFiles mount stream it (sendfile where available);
+    # download=1 keeps it an attachment, see _NoStoreDownloads
+    return RedirectResponse(f"/downloads/{quote(fname)}?download=1", status_code=307)
 
 # ---------- UI ----------
 @app.get("/", response_class=FileResponse)